@@ -0,0 +1,29 @@
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+
+from xspf_lib import Playlist
+
+PASS_TESTCASE_DIR: Path = (
+    Path(__file__).absolute().parent / "testcase" / "version_1" / "pass"
+)
+
+
+@pytest.fixture(scope="session")
+def parsed_playlist() -> Callable[[str], Playlist]:
+    """Parse valid testcase once per session. Tests must not mutate result."""
+    cache: Dict[str, Playlist] = {}
+
+    def parse(filename: str) -> Playlist:
+        if filename not in cache:
+            cache[filename] = Playlist.parse(PASS_TESTCASE_DIR / filename)
+        return cache[filename]
+
+    return parse
+
+
+@pytest.fixture(scope="session")
+def default_xml() -> str:
+    """Serialized default playlist."""
+    return Playlist().xml_string()
@@ -1,12 +1,16 @@
-import os
+import dataclasses
+import io
+import pickle
+import sys
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from datetime import datetime, timezone
 from xml.etree.ElementTree import Element
 
 import pytest
 
 from xspf_lib import Attribution, Extension, Link, Meta, Playlist
 from xspf_lib.elements import Track
+from xspf_lib.utils import escape_attrib, escape_text
 
 
 def test_track_init():
@@ -114,6 +118,82 @@ def test_aattribution_xml_generator():
     assert len(list(atr_null.xml_elements())) == 0
 
 
+def test_escape():
+    value = 'a & b < "c" >\r\n\td'
+    assert escape_text(value) == 'a &amp; b &lt; "c" &gt;\r\n\td'
+    assert escape_attrib(value) == "a &amp; b &lt; &quot;c&quot; &gt;&#13;&#10;&#09;d"
+
+
+def test_xml_string_same_as_xml_element():
+    pl = Playlist(
+        title="",
+        creator='Rock & "Roll" <live>',
+        attribution=[Attribution(), Attribution(location="file:///a&b")],
+        link=[Link('rel"\n&', "")],
+        meta=[Meta("meta_type", "")],
+        extension=[Extension("appl", {"k": "v"}), Extension("empty")],
+        trackList=[Track(), Track(title="", trackNum=0, duration=0)],
+    )
+    assert pl.xml_string() == ET.tostring(pl.to_xml_element(), encoding="unicode")
+
+
+def test_playlist_parse_utc_designator_date():
+    pl = Playlist.parse(
+        io.BytesIO(
+            b'<playlist version="1" xmlns="http://xspf.org/ns/0/">'
+            b"<date>2005-01-08T17:10:47Z</date><trackList/></playlist>"
+        )
+    )
+    assert pl.date == datetime(2005, 1, 8, 17, 10, 47, tzinfo=timezone.utc)
+
+
+def test_playlist_default_date_is_stable():
+    pl = Playlist()
+    assert pl.date.tzinfo is not None
+    assert pl.date is pl.date
+
+
+def test_playlist_equality_survives_pickle():
+    pl = Playlist(title="list", link=[Link("link_type", "link_uri")])
+    restored = pickle.loads(pickle.dumps(pl))
+    assert restored == pl
+    assert restored.date == pl.date and restored == pl
+
+
+def test_playlist_sequence_of_tracks():
+    first, second = Track(title="first"), Track(title="second")
+    pl = Playlist(title="list", trackList=[second])
+    pl.insert(0, first)
+    assert list(pl) == [first, second]
+    assert pl[1] is second and first in pl
+    pl_copy = pl.copy()
+    assert pl_copy == pl
+    del pl_copy[0]
+    assert len(pl_copy) == 1 and len(pl) == 2
+    # `slots` argument of dataclass is available since Python 3.10.
+    if sys.version_info >= (3, 10):
+        assert not hasattr(pl, "__dict__")
+
+
+def test_playlist_data_is_deprecated_track_list():
+    pl = Playlist(trackList=[Track(title="tr1")])
+    with pytest.deprecated_call():
+        assert pl.data is pl.trackList
+
+
+def test_playlist_is_dataclass():
+    pl = Playlist(title="list", trackList=[Track(title="tr1")])
+    renamed = dataclasses.replace(pl, title="renamed")
+    assert renamed.title == "renamed" and renamed.trackList is pl.trackList
+    assert renamed.date == pl.date
+    assert dataclasses.asdict(pl)["title"] == "list"
+
+
+def test_track_repr():
+    assert repr(Track()) == "<Track NONAME>"
+    assert repr(Track(title="t", location="a.mp3")) == '<Track "t" at "a.mp3">'
+
+
 def test_bad_trackNum_creation():
     with pytest.raises(ValueError):
         Track(trackNum=-1)
@@ -146,7 +226,7 @@ def test_bad_duration_string():
         Track(duration="1")
 
 
-def test_playlist_writing():
+def test_playlist_writing(tmp_path):
     killer_queen = Track(
         location="file:///home/music/killer_queen.mp3",
         title="Killer Queen",
@@ -175,8 +255,9 @@ def test_playlist_writing():
         trackList=[killer_queen, anbtd],
     )
     playlist.date = datetime(2020, 4, 20, 12, 30, 1, 123456)
-    playlist.write("some_tracks.xspf")
-    with open("some_tracks.xspf", "r") as file:
+    playlist_path = tmp_path / "some_tracks.xspf"
+    playlist.write(playlist_path)
+    with open(playlist_path, "r") as file:
         playlist_xml = file.read()
     assert (
         playlist_xml == "<?xml version='1.0' encoding='UTF-8'?>\n"
@@ -197,4 +278,60 @@ def test_playlist_writing():
         '<meta rel="meta.namespace">METADATA_INFO</meta></track></trackList>'
         "</playlist>"
     )
-    os.remove("some_tracks.xspf")
+
+
+def test_playlist_writing_to_binary_file():
+    playlist = Playlist(title="Ünicode & more", trackList=[Track(title="tr1")])
+    file = io.BytesIO()
+    playlist.write(file)
+    assert file.getvalue().decode("utf-8") == (
+        "<?xml version='1.0' encoding='UTF-8'?>\n" + playlist.xml_string()
+    )
+
+
+class _WriteOnly:
+    """Object with a `write` method only, outside of the IO hierarchy."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    def getvalue(self):
+        return b"".join(self.chunks)
+
+
+@pytest.mark.parametrize("encoding", ["UTF-8", "utf-16", None])
+def test_playlist_writing_to_write_method_object(encoding):
+    playlist = Playlist(title="Ünicode & more", trackList=[Track(title="tr1")])
+    playlist.date = datetime(2020, 4, 20, 12, 30, 1, 123456)
+    file = _WriteOnly()
+    playlist.write(file, encoding=encoding)
+    expected = io.BytesIO()
+    playlist.xml_eltree.write(expected, encoding=encoding, xml_declaration=True)
+    assert file.getvalue() == expected.getvalue()
+
+
+def test_playlist_parse_many(tmp_path):
+    filenames = []
+    for title in ("first", "second"):
+        filename = tmp_path / f"{title}.xspf"
+        Playlist(title=title, trackList=[Track(title=title)]).write(filename)
+        filenames.append(filename)
+    playlists = Playlist.parse_many(filenames, workers=2)
+    assert [pl.title for pl in playlists] == ["first", "second"]
+    assert [pl[0].title for pl in playlists] == ["first", "second"]
+
+
+def test_namespaced_extension_content_serializes_to_valid_xml():
+    pl = Playlist.parse(
+        io.BytesIO(
+            b'<playlist version="1" xmlns="http://xspf.org/ns/0/"><trackList>'
+            b'<track><extension application="http://example.com/">'
+            b"<info>text</info></extension></track></trackList></playlist>"
+        )
+    )
+    for xml in (pl.xml_string(), ET.tostring(pl.to_xml_element(), encoding="unicode")):
+        content = ET.fromstring(xml).find(".//{http://xspf.org/ns/0/}info")
+        assert content is not None and content.text == "text"
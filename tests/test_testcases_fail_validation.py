@@ -1,3 +1,5 @@
+import io
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
 import pytest
@@ -73,6 +75,35 @@ def test_corrupted_playlist(filename: str, exc: Exception):
         Playlist.parse(get_testcase_path(filename))
 
 
+@pytest.mark.parametrize(
+    "document",
+    [
+        b"<trackList><title>x</title></trackList>",
+        b'<trackList><o:track xmlns:o="http://example.com/" /></trackList>',
+        b'<trackList><track xmlns="" /></trackList>',
+    ],
+)
+def test_corrupted_tracklist_child(document: bytes):
+    document = (
+        b'<playlist version="1" xmlns="http://xspf.org/ns/0/">'
+        + document
+        + b"</playlist>"
+    )
+    with pytest.raises(TypeError):
+        Playlist.parse(io.BytesIO(document))
+    with pytest.raises(TypeError):
+        Playlist.parse_from_xml_element(ET.fromstring(document))
+
+
+def test_root_checked_before_tracks():
+    document = (
+        b'<playlist xmlns="http://xspf.org/ns/0/"><trackList>'
+        b"<track><duration>-1</duration></track></trackList></playlist>"
+    )
+    with pytest.raises(TypeError, match="version attribute"):
+        Playlist.parse(io.BytesIO(document))
+
+
 def test_also_playlist_creation_without_link_rel():
     with pytest.raises(TypeError):
         Playlist(link=[Link(content="file:/let_me_in")])
@@ -83,9 +114,9 @@ def test_also_playlist_creation_without_meta_rel():
         Playlist(meta=[Meta(content="imma content")])
 
 
-def test_also_playlist_create_empty_tracklist_element():
-    assert "<trackList />" in Playlist().xml_string()
+def test_also_playlist_create_empty_tracklist_element(default_xml):
+    assert "<trackList />" in default_xml
 
 
-def test_also_playlist_create_version_attribute():
-    assert 'version="1"' in Playlist().xml_string()
+def test_also_playlist_create_version_attribute(default_xml):
+    assert 'version="1"' in default_xml
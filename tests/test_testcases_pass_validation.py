@@ -1,20 +1,10 @@
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 from typing import List
 
 import pytest
 
 from xspf_lib import Playlist
 
-TESTCASE_DIR: Path = (
-    Path(__file__).absolute().parent / "testcase" / "version_1" / "pass"
-)
-
-
-def get_testcase_path(filename: str) -> Path:
-    return TESTCASE_DIR / filename
-
-
 valid_playlists: List[str] = [
     "playlist-empty-annotation.xspf",
     "playlist-empty-creator.xspf",
@@ -51,23 +41,23 @@ valid_playlists: List[str] = [
 
 
 @pytest.mark.parametrize("filename", valid_playlists)
-def test_playlist_parse(filename: str):
-    Playlist.parse(get_testcase_path(filename))
+def test_playlist_parse(parsed_playlist, filename: str):
+    assert isinstance(parsed_playlist(filename), Playlist)
 
 
-def test_track_whitespace_int():
-    pl = Playlist.parse(get_testcase_path("track-whitespace-nonNegativeInteger.xspf"))
+def test_track_whitespace_int(parsed_playlist):
+    pl = parsed_playlist("track-whitespace-nonNegativeInteger.xspf")
     for i in range(4):
         assert pl[i].duration == 1
 
 
-def test_playlist_extension():
-    pl = Playlist.parse(get_testcase_path("playlist-extension.xspf"))
+def test_playlist_extension(parsed_playlist):
+    pl = parsed_playlist("playlist-extension.xspf")
     assert pl.extension[0].application == "http://localhost/some/valid/url"
 
 
-def test_playlist_extensive():
-    pl = Playlist.parse(get_testcase_path("playlist-extensive.xspf"))
+def test_playlist_extensive(parsed_playlist):
+    pl = parsed_playlist("playlist-extensive.xspf")
     assert pl.title == "My playlist"
     assert pl.creator == "Jane Doe"
     assert pl.annotation == "My favorite songs"
@@ -94,8 +84,8 @@ def test_playlist_extensive():
     assert len(pl.trackList) == 0
 
 
-def test_playlist_inverted_order():
-    pl = Playlist.parse(get_testcase_path("playlist-inverted-order.xspf"))
+def test_playlist_inverted_order(parsed_playlist):
+    pl = parsed_playlist("playlist-inverted-order.xspf")
     assert pl.title == "some text"
     assert pl.creator == "some text"
     assert pl.annotation == "some text"
@@ -119,13 +109,13 @@ def test_playlist_inverted_order():
     assert len(pl.trackList) == 0
 
 
-def test_playlist_namespace_nested_proper():
-    pl = Playlist.parse(get_testcase_path("playlist-namespace-nested-proper.xspf"))
+def test_playlist_namespace_nested_proper(parsed_playlist):
+    pl = parsed_playlist("playlist-namespace-nested-proper.xspf")
     assert pl.extension[0].application == "http://example.com/"
 
 
-def test_playlist_relative_paths():
-    pl = Playlist.parse(get_testcase_path("playlist-relative-paths.xspf"))
+def test_playlist_relative_paths(parsed_playlist):
+    pl = parsed_playlist("playlist-relative-paths.xspf")
     assert pl[0].location[0] == "../01-Ain't Mine.flac"
     assert pl[0].title == "Ain't Mine"
     assert pl[1].location[0] == "02-Solitude over the River.flac"
@@ -134,22 +124,22 @@ def test_playlist_relative_paths():
     assert pl[2].title == "Jack Man"
 
 
-def test_playlist_whitespace_dateTime():
-    pl = Playlist.parse(get_testcase_path("playlist-whitespace-dateTime.xspf"))
+def test_playlist_whitespace_dateTime(parsed_playlist):
+    pl = parsed_playlist("playlist-whitespace-dateTime.xspf")
     assert pl.date == datetime(
         2005, 1, 8, 17, 10, 47, tzinfo=timezone(timedelta(hours=-5))
     )
 
 
-def test_track_extension():
-    tr = Playlist.parse(get_testcase_path("track-extension.xspf"))[0]
+def test_track_extension(parsed_playlist):
+    tr = parsed_playlist("track-extension.xspf")[0]
     assert tr.extension[0].application == "http://localhost/some/valid/url"
     assert len(tr.extension) == 1
     assert len(tr.extension[0].content) == 2
 
 
-def test_track_extensive():
-    tr = Playlist.parse(get_testcase_path("track-extensive.xspf"))[0]
+def test_track_extensive(parsed_playlist):
+    tr = parsed_playlist("track-extensive.xspf")[0]
     assert len(tr.location) == 1
     assert tr.location[0] == "http://example.com/my.mp3"
     assert len(tr.identifier) == 1
@@ -172,8 +162,8 @@ def test_track_extensive():
     assert tr.extension[0].application == "http://example.com"
 
 
-def test_track_inverted_order():
-    tr = Playlist.parse(get_testcase_path("track-inverted-order.xspf"))[0]
+def test_track_inverted_order(parsed_playlist):
+    tr = parsed_playlist("track-inverted-order.xspf")[0]
     assert len(tr.location) == 1
     assert tr.location[0] == "http://example.com/"
     assert len(tr.identifier) == 1
@@ -185,20 +175,17 @@ def test_track_inverted_order():
     assert tr.image == "http://example.com/"
     assert tr.trackNum == 2
     assert tr.duration == 120000
-    assert len(tr.link) == 2
-    assert all(link.rel == "http://example.com/" for link in tr.link)
-    assert all(link.content == "http://example.com/" for link in tr.link)
-    assert len(tr.meta) == 2
-    assert all(meta.rel == "http://example.com/" for meta in tr.meta)
-    assert all(meta.content == "value" for meta in tr.meta)
-    assert len(tr.extension) == 2
-    assert all(
-        extension.application == "http://example.com/" for extension in tr.extension
-    )
+    assert [link.rel for link in tr.link] == ["http://example.com/"] * 2
+    assert [link.content for link in tr.link] == ["http://example.com/"] * 2
+    assert [meta.rel for meta in tr.meta] == ["http://example.com/"] * 2
+    assert [meta.content for meta in tr.meta] == ["value"] * 2
+    assert [extension.application for extension in tr.extension] == [
+        "http://example.com/"
+    ] * 2
 
 
-def test_track_whitespace_anyURI():
-    tr = Playlist.parse(get_testcase_path("track-whitespace-anyURI.xspf"))[0]
+def test_track_whitespace_anyURI(parsed_playlist):
+    tr = parsed_playlist("track-whitespace-anyURI.xspf")[0]
     assert len(tr.location) == 4
     assert tr.location[0] == "http://example.com/no_whitespace/"
     assert tr.location[1] == "http://example.com/whitespace_before/"
@@ -206,8 +193,8 @@ def test_track_whitespace_anyURI():
     assert tr.location[3] == "http://example.com/whitespace_before_and_after/"
 
 
-def test_track_whitespace_nonNegativeInteger():
-    pl = Playlist.parse(get_testcase_path("track-whitespace-nonNegativeInteger.xspf"))
+def test_track_whitespace_nonNegativeInteger(parsed_playlist):
+    pl = parsed_playlist("track-whitespace-nonNegativeInteger.xspf")
     assert len(pl) == 4
     for tr in pl:
         assert tr.duration == 1
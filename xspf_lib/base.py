@@ -5,6 +5,8 @@ from xml.etree import ElementTree as Et
 
 
 class XMLAble(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def to_xml_element(self) -> Et.Element:
         """Convert data model to :py:class:`xml.etree.ElementTree.Element`"""
@@ -1,16 +1,23 @@
 __all__ = ["build_playlist", "build_track"]
 
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Union
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Tuple, Union
 from xml.etree import ElementTree as Et
 
 from .base import XMLAble
-from .constants import XML_NAMESPACE
+from .constants import PLAYLIST_SIMPLE_FIELDS, TRACK_SIMPLE_FIELDS, XML_NAMESPACE
 from .utils import quote
 
 if TYPE_CHECKING:
     from .elements import Playlist, Track
 
+_SubElement = Et.SubElement
+
+_get_track_simple_fields = attrgetter(*TRACK_SIMPLE_FIELDS)
+_get_playlist_simple_fields = attrgetter(*PLAYLIST_SIMPLE_FIELDS)
+
 
 class _XMLBuilder:
     def __init__(self):
@@ -22,14 +29,7 @@ class _XMLBuilder:
 
         self.add_locations()
         self.add_identifiers()
-        self.add_title()
-        self.add_creator()
-        self.add_annotation()
-        self.add_info()
-        self.add_image()
-        self.add_album()
-        self.add_track_num()
-        self.add_duration()
+        self.add_simple_subelements(TRACK_SIMPLE_FIELDS, _get_track_simple_fields)
         self.add_links()
         self.add_metas()
         self.add_extensions()
@@ -42,13 +42,7 @@ class _XMLBuilder:
             "playlist", {"version": "1", "xmlns": XML_NAMESPACE["xspf"]}
         )
 
-        self.add_title()
-        self.add_creator()
-        self.add_annotation()
-        self.add_info()
-        self.add_location()
-        self.add_identifier()
-        self.add_image()
+        self.add_simple_subelements(PLAYLIST_SIMPLE_FIELDS, _get_playlist_simple_fields)
         self.add_date()
         self.add_license()
         self.add_attribution()
@@ -61,54 +55,38 @@ class _XMLBuilder:
 
     def add_locations(self):
         if self.entity.location is not None:
+            xml_element = self.xml_element
             for loc in self.entity.location:
-                Et.SubElement(self.xml_element, "location").text = str(quote(loc))
+                loc = quote(loc)
+                _SubElement(xml_element, "location").text = (
+                    loc if type(loc) is str else str(loc)
+                )
 
     def add_identifiers(self):
         if self.entity.identifier is not None:
+            xml_element = self.xml_element
             for id in self.entity.identifier:
-                Et.SubElement(self.xml_element, "identifier").text = str(id)
+                _SubElement(xml_element, "identifier").text = (
+                    id if type(id) is str else str(id)
+                )
 
     def add_license(self):
         self.add_simple_subelement("license")
 
     def add_attribution(self):
         if len(self.entity.attribution) > 0:
-            attribution = Et.SubElement(self.xml_element, "attribution")
-            for attr in self.entity.attribution[0:9]:
+            attribution = _SubElement(self.xml_element, "attribution")
+            for attr in islice(self.entity.attribution, 9):
                 if attr.location is not None:
-                    Et.SubElement(attribution, "location").text = attr.location
+                    _SubElement(attribution, "location").text = attr.location
                 if attr.identifier is not None:
-                    Et.SubElement(attribution, "identifier").text = attr.identifier
+                    _SubElement(attribution, "identifier").text = attr.identifier
 
     def add_tracklist(self):
-        Et.SubElement(self.xml_element, "trackList").extend(
-            track.to_xml_element() for track in self.entity.trackList
-        )
-
-    def add_title(self):
-        self.add_simple_subelement("title")
-
-    def add_creator(self):
-        self.add_simple_subelement("creator")
-
-    def add_annotation(self):
-        self.add_simple_subelement("annotation")
-
-    def add_info(self):
-        self.add_simple_subelement("info")
-
-    def add_image(self):
-        self.add_simple_subelement("image")
-
-    def add_album(self):
-        self.add_simple_subelement("album")
-
-    def add_track_num(self):
-        self.add_simple_subelement("trackNum")
-
-    def add_duration(self):
-        self.add_simple_subelement("duration")
+        track_list = _SubElement(self.xml_element, "trackList")
+        track_builder = _XMLBuilder()
+        for track in self.entity.trackList:
+            track_list.append(track_builder.build_track(track))
 
     def add_links(self):
         self.add_iterable_parameter("link")
@@ -119,25 +97,31 @@ class _XMLBuilder:
     def add_extensions(self):
         self.add_iterable_parameter("extension")
 
-    def add_location(self):
-        self.add_simple_subelement("location")
-
-    def add_identifier(self):
-        self.add_simple_subelement("identifier")
-
     def add_date(self):
-        Et.SubElement(self.xml_element, "date").text = self.entity.date.isoformat()
+        _SubElement(self.xml_element, "date").text = self.entity.date.isoformat()
 
     def add_simple_subelement(self, parameter_name: str):
         parameter = getattr(self.entity, parameter_name, None)
         if parameter is not None:
-            Et.SubElement(self.xml_element, parameter_name).text = str(parameter)
+            _SubElement(self.xml_element, parameter_name).text = str(parameter)
+
+    def add_simple_subelements(
+        self, parameter_names: Tuple[str, ...], get_parameters: attrgetter
+    ):
+        xml_element = self.xml_element
+        for parameter_name, parameter in zip(
+            parameter_names, get_parameters(self.entity)
+        ):
+            if parameter is not None:
+                _SubElement(xml_element, parameter_name).text = (
+                    parameter if type(parameter) is str else str(parameter)
+                )
 
     def add_iterable_parameter(self, parameter_name: str):
         parameter_iter: Iterable[XMLAble] = getattr(self.entity, parameter_name)
-        self.xml_element.extend(
-            parameter.to_xml_element() for parameter in parameter_iter
-        )
+        append = self.xml_element.append
+        for parameter in parameter_iter:
+            append(parameter.to_xml_element())
 
 
 def build_track(track: "Track") -> Et.Element:
@@ -1,3 +1,5 @@
+import sys
+
 # URI checker By RFC 3986
 lowalpha = "abcdefghijklmnopqrstuvwxyz"
 upalpha = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
@@ -11,3 +13,37 @@ quoted = "%"
 URI_CHARACTERS = reserved + unreserved + quoted
 
 XML_NAMESPACE = {"xspf": "http://xspf.org/ns/0/"}
+
+# Text-only leaf elements in document order, skipped when their value is None.
+TRACK_SIMPLE_FIELDS = (
+    "title",
+    "creator",
+    "annotation",
+    "info",
+    "image",
+    "album",
+    "trackNum",
+    "duration",
+)
+PLAYLIST_SIMPLE_FIELDS = (
+    "title",
+    "creator",
+    "annotation",
+    "info",
+    "location",
+    "identifier",
+    "image",
+)
+
+# Qualified `{namespace}tag` names of XSPF elements, as seen by ElementTree.
+XSPF_TAG_PREFIX = sys.intern("{" + XML_NAMESPACE["xspf"] + "}")
+XSPF_TAGS = {
+    name: sys.intern(XSPF_TAG_PREFIX + name)
+    for name in (
+        "playlist",
+        "trackList",
+        "track",
+        "location",
+        "identifier",
+    )
+}
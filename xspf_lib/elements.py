@@ -1,18 +1,36 @@
-from collections import UserList
+import copy
+import sys
+import warnings
+from collections.abc import MutableSequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Iterable, Iterator, List, Optional, Union
+from os import PathLike
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 from urllib import parse as urlparse
 from xml.etree import ElementTree as Et
 
 from .base import XMLAble
 from .builders import build_playlist, build_track
-from .constants import XML_NAMESPACE
+from .constants import XSPF_TAGS
 from .types import URI, Milliseconds
 from .utils import quote, urify
+from .writers import open_writer, write_playlist, write_track
 
+# `slots` argument of dataclass is available since Python 3.10.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass()
+
+def _as_uri_list(value: Union[Iterable[URI], URI, None]) -> List[URI]:
+    """Wrap single URI into list, copy iterable of URIs into new list."""
+    # Exact type check first, it is the common case and cheaper than isinstance.
+    if type(value) is str or isinstance(value, URI):
+        return [value]
+    if value is None:
+        return []
+    return list(value)
+
+
+@dataclass(**_SLOTS)
 class Extension(XMLAble):
     """
     Class for XML extensions of XSPF playlists and tracks.
@@ -53,11 +71,13 @@ class Extension(XMLAble):
             raise TypeError("Extension parsing missing attribute `application`")
         attribs = dict([item for item in element.items() if item[0] != "application"])
         return Extension(
-            application=application, extra_attrib=attribs, content=list(element)
+            application=sys.intern(application),
+            extra_attrib=attribs,
+            content=list(element),
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Link(XMLAble):
     """Object representation of `link` element.
 
@@ -82,7 +102,7 @@ class Link(XMLAble):
             raise TypeError(
                 "`rel` attribute of link is missing\n" f"{Et.tostring(element)}"
             )
-        return Link(rel=rel, content=urify(element.text))
+        return Link(rel=sys.intern(rel), content=urify(element.text))
 
     def to_xml_element(self) -> Et.Element:
         el = Et.Element("link", {"rel": str(self.rel)})
@@ -90,7 +110,7 @@ class Link(XMLAble):
         return el
 
 
-@dataclass()
+@dataclass(**_SLOTS)
 class Meta(XMLAble):
     """Object representation of `meta` element.
 
@@ -110,7 +130,7 @@ class Meta(XMLAble):
     @staticmethod
     def parse_from_xml_element(element):
         # Check for markup.
-        if len(list(element)) > 0:
+        if len(element) > 0:
             raise ValueError(
                 "Got nested elements in expected text. "
                 "Probably, this is unexpected HTML insertion.\n"
@@ -121,7 +141,7 @@ class Meta(XMLAble):
             raise TypeError(
                 "`rel` attribute of meta is missing\n" f"{Et.tostring(element)}"
             )
-        return Meta(rel=rel, content=element.text)
+        return Meta(rel=sys.intern(rel), content=element.text)
 
     def to_xml_element(self) -> Et.Element:
         el = Et.Element("meta", {"rel": str(self.rel)})
@@ -129,7 +149,7 @@ class Meta(XMLAble):
         return el
 
 
-@dataclass()
+@dataclass(**_SLOTS)
 class Attribution(XMLAble):
     """Object representation of `attribution` element.
 
@@ -163,9 +183,9 @@ class Attribution(XMLAble):
 
     @staticmethod
     def parse_from_xml_element(element) -> "Attribution":
-        if element.tag == "".join(["{", XML_NAMESPACE["xspf"], "}location"]):
+        if element.tag == XSPF_TAGS["location"]:
             return Attribution(location=urlparse.unquote(urify(element.text.strip())))
-        elif element.tag == "".join(["{", XML_NAMESPACE["xspf"], "}identifier"]):
+        elif element.tag == XSPF_TAGS["identifier"]:
             return Attribution(identifier=urify(element.text))
         else:
             # No `location` and `identifier` attribution is not allowed
@@ -231,17 +251,9 @@ class Track(XMLAble):
         :param extension: Extension of non-XSPF XML elements.
         :type extension: list[:py:class:`xspf_lib.Extension`] | None
         """
-        if isinstance(location, URI):
-            location = [location]
-        elif location is None:
-            location = []
-        self.location = list(location)
+        self.location = _as_uri_list(location)
         """URI or list of URI of resource to be rendered."""
-        if isinstance(identifier, URI):
-            identifier = [identifier]
-        elif identifier is None:
-            identifier = []
-        self.identifier = list(identifier)
+        self.identifier = _as_uri_list(identifier)
         """Canonical ID or list of ID for this resource."""
         self.title = title
         """Name of the track."""
@@ -279,23 +291,43 @@ class Track(XMLAble):
         "info",
         "image",
         "album",
+        "__trackNum",
+        "__duration",
         "link",
         "meta",
         "extension",
     )
 
+    @classmethod
+    def _make_unchecked(cls, **fields: Any) -> "Track":
+        """Create track from trusted `fields` without `__init__` checks.
+
+        Values are stored as is: no list normalization of `location` and
+        `identifier`, no validation of `trackNum` and `duration`.
+        """
+        track = cls.__new__(cls)
+        track.location = fields.pop("location", [])
+        track.identifier = fields.pop("identifier", [])
+        track.title = fields.pop("title", None)
+        track.creator = fields.pop("creator", None)
+        track.annotation = fields.pop("annotation", None)
+        track.info = fields.pop("info", None)
+        track.image = fields.pop("image", None)
+        track.album = fields.pop("album", None)
+        track.__trackNum = fields.pop("trackNum", None)
+        track.__duration = fields.pop("duration", None)
+        track.link = fields.pop("link", [])
+        track.meta = fields.pop("meta", [])
+        track.extension = fields.pop("extension", [])
+        if fields:
+            raise TypeError(f"Unexpected track fields {list(fields)}.")
+        return track
+
     def __repr__(self) -> str:
         """Return representation `repr(self)`."""
-        repr = "<Track"
-        if self.title is not None:
-            repr += f'"{self.title}"'
-        else:
-            repr += " NONAME"
-        if self.location is not None:
-            repr += f' at "{self.location[0]}">'
-        else:
-            repr += ">"
-        return repr
+        name = f' "{self.title}"' if self.title is not None else " NONAME"
+        at = f' at "{self.location[0]}"' if self.location else ""
+        return f"<Track{name}{at}>"
 
     @property
     def trackNum(self) -> Optional[int]:
@@ -333,7 +365,9 @@ class Track(XMLAble):
 
     def xml_string(self) -> str:
         """Return XML representation of track."""
-        return Et.tostring(self.to_xml_element(), encoding="UTF-8").decode()
+        parts: List[str] = []
+        write_track(self, parts.append)
+        return "".join(parts)
 
     @staticmethod
     def parse_from_xml_element(element) -> "Track":
@@ -342,8 +376,8 @@ class Track(XMLAble):
         return TrackBaseParser(element).parse()
 
 
-@dataclass(repr=False)
-class Playlist(UserList, XMLAble):
+@dataclass(**_SLOTS)
+class Playlist(MutableSequence, XMLAble):
     """
     Playlist info class.
 
@@ -403,10 +437,8 @@ class Playlist(UserList, XMLAble):
     """Canonical URI for the playlist."""
     image: Optional[URI] = None
     """URI of image to display in the absence of track image."""
-    date: datetime = field(
-        default_factory=lambda: datetime.now(timezone.utc).astimezone()
-    )
-    """Datetime of creation of playlist."""
+    date: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    """Datetime of creation of playlist, the current UTC time by default."""
     license: Optional[URI] = None
     """URI of resource that describes the licence of playlist."""
     attribution: List[Union["Playlist", Attribution]] = field(default_factory=list)
@@ -421,10 +453,56 @@ class Playlist(UserList, XMLAble):
     """Ordered list of track elements."""
 
     @property
-    def data(self):
-        """`self.data` member required by `collections.UserList` class."""
+    def data(self) -> List[Track]:
+        """Track list, `self.data` member of former `collections.UserList` base.
+
+        .. deprecated:: Use :py:attr:`trackList` instead.
+        """
+        warnings.warn(
+            "Playlist.data is deprecated, use Playlist.trackList instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return self.trackList
 
+    def __len__(self) -> int:
+        return len(self.trackList)
+
+    def __iter__(self) -> Iterator[Track]:
+        return iter(self.trackList)
+
+    def __getitem__(self, index):
+        """Return track or list of tracks from the track list."""
+        return self.trackList[index]
+
+    def __setitem__(self, index, track) -> None:
+        self.trackList[index] = track
+
+    def __delitem__(self, index) -> None:
+        del self.trackList[index]
+
+    def insert(self, index: int, track: Track) -> None:
+        """Insert track before index."""
+        self.trackList.insert(index, track)
+
+    def append(self, track: Track) -> None:
+        """Append track to the end of the track list."""
+        self.trackList.append(track)
+
+    def extend(self, tracks: Iterable[Track]) -> None:
+        """Extend the track list by appending tracks from the iterable."""
+        self.trackList.extend(tracks)
+
+    def sort(self, *args, **kwargs) -> None:
+        """Sort the track list in place, arguments are as of `list.sort`."""
+        self.trackList.sort(*args, **kwargs)
+
+    def copy(self) -> "Playlist":
+        """Return shallow copy of playlist with its own track list."""
+        playlist = copy.copy(self)
+        playlist.trackList = list(self.trackList)
+        return playlist
+
     def __repr__(self):
         """Return representation `repr.self`."""
         repr = "<Playlist"
@@ -444,17 +522,15 @@ class Playlist(UserList, XMLAble):
 
     def xml_string(self) -> str:
         """Return XML representation of playlist."""
-        return Et.tostring(self.to_xml_element(), encoding="UTF-8").decode()
+        parts: List[str] = []
+        write_playlist(self, parts.append)
+        return "".join(parts)
 
     def write(self, file_or_filename, encoding="UTF-8") -> None:
         """Write playlist into file."""
-        self.xml_eltree.write(
-            file_or_filename,
-            encoding=encoding,
-            method="xml",
-            short_empty_elements=True,
-            xml_declaration=True,
-        )
+        with open_writer(file_or_filename, encoding) as (write, declared_encoding):
+            write(f"<?xml version='1.0' encoding='{declared_encoding}'?>\n")
+            write_playlist(self, write)
 
     @classmethod
     def parse(cls, filename: Union[str, bytes, int]) -> "Playlist":
@@ -467,7 +543,35 @@ class Playlist(UserList, XMLAble):
         >>> import xspf_lib
         >>> playlist = xspf_lib.parse("./playlist_file.xspf")
         """
-        return cls.parse_from_xml_element(Et.parse(filename).getroot())
+        from .parsers import PlaylistStreamParser
+
+        return PlaylistStreamParser(filename).parse()
+
+    @classmethod
+    def parse_many(
+        cls,
+        filenames: Iterable[Union[str, bytes, "PathLike[str]"]],
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+    ) -> List["Playlist"]:
+        """
+        Parse XSPF files in parallel worker processes.
+
+        :param filenames: Paths of files to parse. File descriptors are not
+            accepted, they are not valid in worker processes.
+        :param workers: Maximum number of worker processes, defaults to the
+            number of processors.
+        :param chunksize: Number of files sent to a worker at once.
+        :returns: parsed playlists in the order of `filenames`
+        :rtype: list[Playlist]
+
+        >>> import xspf_lib
+        >>> playlists = xspf_lib.Playlist.parse_many(["a.xspf", "b.xspf"])
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls.parse, filenames, chunksize=chunksize))
 
     @staticmethod
     def parse_from_xml_element(root) -> "Playlist":
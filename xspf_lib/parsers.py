@@ -1,22 +1,100 @@
-__all__ = ["TrackBaseParser", "PlaylistBaseParser"]
+__all__ = ["TrackBaseParser", "PlaylistBaseParser", "PlaylistStreamParser"]
 
+import sys
 from datetime import datetime
-from typing import Any, Generic, Optional, TypeVar, Union
+from typing import (
+    IO,
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 from urllib import parse as urlparse
 from xml.etree import ElementTree as Et
 
-from .constants import XML_NAMESPACE
+from .constants import XML_NAMESPACE, XSPF_TAG_PREFIX, XSPF_TAGS
 from .elements import Attribution, Extension, Link, Meta, Playlist, Track
 from .utils import urify
 
 T = TypeVar("T", bound=Union[Track, Playlist])
 
+_PLAYLIST_TAG = XSPF_TAGS["playlist"]
+_TRACKLIST_TAG = XSPF_TAGS["trackList"]
+_TRACK_TAG = XSPF_TAGS["track"]
+_XSPF_PREFIX_LEN = len(XSPF_TAG_PREFIX)
+
+_TRACK_SINGLE_ELEMENTS = frozenset(
+    [
+        "title",
+        "creator",
+        "annotation",
+        "info",
+        "image",
+        "album",
+        "trackNum",
+        "duration",
+    ]
+)
+_PLAYLIST_SINGLE_ELEMENTS = frozenset(
+    [
+        "title",
+        "creator",
+        "annotation",
+        "info",
+        "location",
+        "identifier",
+        "image",
+        "date",
+        "license",
+        "attribution",
+        "trackList",
+    ]
+)
+
 
 class BaseParser(Generic[T]):
     parsing_entity: T
 
-    def __init__(self, xml_element: Et.Element):
+    def __init__(
+        self, xml_element: Et.Element, strings: Optional[Dict[str, str]] = None
+    ):
         self.xml_element = xml_element
+        self.children = self.group_children_by_tag(xml_element)
+        self.strings: Dict[str, str] = strings if strings is not None else {}
+        """Already seen string values, shared between parsers of a document."""
+
+    def intern(self, value: str) -> str:
+        """Return already seen equal string to share it between entities."""
+        return self.strings.setdefault(value, value)
+
+    @staticmethod
+    def group_children_by_tag(element: Et.Element) -> Dict[str, List[Et.Element]]:
+        """Collect XSPF children of element by local name in a single pass."""
+        children: Dict[str, List[Et.Element]] = {}
+        for child in element:
+            tag = child.tag
+            # Comments and processing instructions have no string tag.
+            if not isinstance(tag, str) or not tag.startswith(XSPF_TAG_PREFIX):
+                continue
+            # Interned name is the same object as the literal used for lookup.
+            name = sys.intern(tag[_XSPF_PREFIX_LEN:])
+            try:
+                children[name].append(child)
+            except KeyError:
+                children[name] = [child]
+        return children
+
+    def find_children(self, element_name: str) -> Sequence[Et.Element]:
+        return self.children.get(element_name, ())
+
+    def find_child(self, element_name: str) -> Optional[Et.Element]:
+        children = self.find_children(element_name)
+        return children[0] if children else None
 
     @staticmethod
     def check_element_nonleaf_content(element: Et.Element) -> None:
@@ -33,7 +111,8 @@ class BaseParser(Generic[T]):
 
     def insert_creator(self) -> None:
         creator = self.get_xml_leaf_parameter_value("creator")
-        self.insert_parameter_if_not_null("creator", creator)
+        if creator is not None:
+            self.insert_parameter_if_not_null("creator", self.intern(creator))
 
     def insert_annotation(self) -> None:
         annotation = self.get_xml_leaf_parameter_value("annotation")
@@ -49,20 +128,18 @@ class BaseParser(Generic[T]):
 
     def insert_links(self) -> None:
         self.parsing_entity.link.extend(
-            Link.parse_from_xml_element(link)
-            for link in self.xml_element.findall("xspf:link", XML_NAMESPACE)
+            Link.parse_from_xml_element(link) for link in self.find_children("link")
         )
 
     def insert_metas(self) -> None:
         self.parsing_entity.meta.extend(
-            Meta.parse_from_xml_element(meta)
-            for meta in self.xml_element.findall("xspf:meta", XML_NAMESPACE)
+            Meta.parse_from_xml_element(meta) for meta in self.find_children("meta")
         )
 
     def insert_extensions(self) -> None:
         self.parsing_entity.extension.extend(
             Extension.parse_from_xml_element(extension)
-            for extension in self.xml_element.findall("xspf:extension", XML_NAMESPACE)
+            for extension in self.find_children("extension")
         )
 
     def insert_parameter_if_not_null(
@@ -88,8 +165,7 @@ class BaseParser(Generic[T]):
     def _get_xml_leaf_parameter_value_with_urify(
         self, parameter_name: str, need_urify: bool = False
     ) -> Optional[str]:
-        self.check_single_element_in_root(parameter_name)
-        parameter = self.xml_element.find("xspf:" + parameter_name, XML_NAMESPACE)
+        parameter = self.find_child(parameter_name)
         if parameter is None:
             return None
         self.check_inserted_markup(parameter)
@@ -99,17 +175,18 @@ class BaseParser(Generic[T]):
             return None
         return ret_text if not need_urify else urify(ret_text)
 
-    def check_single_element_in_root(self, element_name: str) -> None:
-        if len(self.xml_element.findall("xspf:" + element_name, XML_NAMESPACE)) > 1:
-            raise TypeError(
-                f"Got too many `{element_name}` elements in "
-                "playlist.\n"
-                f"{Et.tostring(self.xml_element)}"
-            )
+    def check_single_elements(self, element_names: FrozenSet[str]) -> None:
+        for element_name, elements in self.children.items():
+            if len(elements) > 1 and element_name in element_names:
+                raise TypeError(
+                    f"Got too many `{element_name}` elements in "
+                    "playlist.\n"
+                    f"{Et.tostring(self.xml_element)}"
+                )
 
     @staticmethod
     def check_inserted_markup(element) -> None:
-        if len(list(element)) > 0:
+        if len(element) > 0:
             raise ValueError(
                 "Got nested elements in expected text. "
                 "Probably, this is unexpected HTML "
@@ -130,9 +207,12 @@ class BaseParser(Generic[T]):
 
 
 class TrackBaseParser(BaseParser[Track]):
-    def __init__(self, xml_element: Et.Element):
-        super().__init__(xml_element)
-        self.parsing_entity = Track()
+    def __init__(
+        self, xml_element: Et.Element, strings: Optional[Dict[str, str]] = None
+    ):
+        super().__init__(xml_element, strings)
+        # Parsed values are validated while inserted.
+        self.parsing_entity = Track._make_unchecked()
 
     def parse(self) -> Track:
         self.check_all_track_element()
@@ -142,9 +222,10 @@ class TrackBaseParser(BaseParser[Track]):
     def check_all_track_element(self) -> None:
         self.check_root_name_and_namespace()
         self.check_track_nonleaf_content()
+        self.check_single_elements(_TRACK_SINGLE_ELEMENTS)
 
     def check_root_name_and_namespace(self) -> None:
-        if self.xml_element.tag != f'{{{XML_NAMESPACE["xspf"]}}}track':
+        if self.xml_element.tag != _TRACK_TAG:
             raise TypeError(
                 "Track element not contain 'track' tag ",
                 "or namespace setted wrong",
@@ -169,26 +250,27 @@ class TrackBaseParser(BaseParser[Track]):
         self.insert_extensions()
 
     def insert_locations(self) -> None:
-        locations = self.xml_element.findall("xspf:location", XML_NAMESPACE)
+        locations = self.find_children("location")
         if len(locations) > 0:
             self.parsing_entity.location = [
-                urlparse.unquote(urify(location.text.strip()))
+                self.intern(urlparse.unquote(urify(location.text.strip())))
                 for location in locations
                 if location.text is not None
             ]
 
     def insert_identifiers(self) -> None:
-        identifiers = self.xml_element.findall("xspf:identifier", XML_NAMESPACE)
+        identifiers = self.find_children("identifier")
         if len(identifiers) > 0:
             self.parsing_entity.identifier = [
-                urlparse.unquote(urify(identifier.text.strip()))
+                self.intern(urlparse.unquote(urify(identifier.text.strip())))
                 for identifier in identifiers
                 if identifier.text is not None
             ]
 
     def insert_album(self) -> None:
         album = self.get_xml_leaf_parameter_value("album")
-        self.insert_parameter_if_not_null("album", album)
+        if album is not None:
+            self.insert_parameter_if_not_null("album", self.intern(album))
 
     def insert_track_num(self) -> None:
         track_num = self.get_xml_leaf_parameter_int_value("trackNum")
@@ -200,9 +282,17 @@ class TrackBaseParser(BaseParser[Track]):
 
 
 class PlaylistBaseParser(BaseParser[Playlist]):
-    def __init__(self, xml_element: Et.Element):
-        super().__init__(xml_element)
+    def __init__(
+        self,
+        xml_element: Et.Element,
+        parsed_tracks: Optional[List[Track]] = None,
+        strings: Optional[Dict[str, str]] = None,
+        track_error: Optional[Exception] = None,
+    ):
+        super().__init__(xml_element, strings)
         self.parsing_entity = Playlist()
+        self.parsed_tracks = parsed_tracks
+        self.track_error = track_error
 
     def parse(self) -> Playlist:
         self.check_all_in_root_element()
@@ -210,47 +300,54 @@ class PlaylistBaseParser(BaseParser[Playlist]):
         return self.parsing_entity
 
     def check_all_in_root_element(self) -> None:
-        self.check_namespace_is_exist()
-        self.check_for_right_namespace_string()
-        self.check_root_tag_name()
-        self.check_version_attribute_is_exist()
-        self.check_forbidden_root_attributes()
-        self.check_value_of_version()
+        self.check_root_tag_and_attributes(self.xml_element)
         self.check_root_nonleaf_content()
+        self.check_single_elements(_PLAYLIST_SINGLE_ELEMENTS)
 
-    def check_namespace_is_exist(self) -> None:
-        if not self.xml_element.tag[0] == "{":
+    @classmethod
+    def check_root_tag_and_attributes(cls, root: Et.Element) -> None:
+        cls.check_namespace_is_exist(root)
+        cls.check_for_right_namespace_string(root)
+        cls.check_root_tag_name(root)
+        cls.check_version_attribute_is_exist(root)
+        cls.check_forbidden_root_attributes(root)
+        cls.check_value_of_version(root)
+
+    @staticmethod
+    def check_namespace_is_exist(root: Et.Element) -> None:
+        if not root.tag[0] == "{":
             raise TypeError(
-                "Playlist namespace attribute is missing.\n"
-                f"{Et.tostring(self.xml_element)}"
+                f"Playlist namespace attribute is missing.\n{Et.tostring(root)}"
             )
 
-    def check_for_right_namespace_string(self) -> None:
-        if not self.xml_element.tag.startswith(
-            "".join(["{", XML_NAMESPACE["xspf"], "}"])
-        ):
-            wrong_namespace = self.xml_element.tag.split("}")[0].lstrip("{")
+    @staticmethod
+    def check_for_right_namespace_string(root: Et.Element) -> None:
+        if not root.tag.startswith(XSPF_TAG_PREFIX):
+            wrong_namespace = root.tag.split("}")[0].lstrip("{")
             raise ValueError(
                 "Namespace is wrong string.\n"
                 f"| Expected `{XML_NAMESPACE['xspf']}`.\n"
                 f"| Got `{wrong_namespace}`."
             )
 
-    def check_root_tag_name(self) -> None:
-        if self.xml_element.tag != "".join(["{", XML_NAMESPACE["xspf"], "}playlist"]):
+    @staticmethod
+    def check_root_tag_name(root: Et.Element) -> None:
+        if root.tag != _PLAYLIST_TAG:
             raise ValueError(
                 "Root tag name is not correct.\n"
                 "| Expected: `playlist`.\n"
-                f"| Got: `{self.xml_element.tag.split('}')[1]}`"
+                f"| Got: `{root.tag.split('}')[1]}`"
             )
 
-    def check_version_attribute_is_exist(self) -> None:
+    @staticmethod
+    def check_version_attribute_is_exist(root: Et.Element) -> None:
         # Version attribute check.
-        if "version" not in self.xml_element.keys():
+        if "version" not in root.keys():
             raise TypeError("version attribute of playlist is missing.")
 
-    def check_forbidden_root_attributes(self) -> None:
-        root_attribs = self.xml_element.keys()
+    @staticmethod
+    def check_forbidden_root_attributes(root: Et.Element) -> None:
+        root_attribs = root.keys()
         if not (
             root_attribs == ["version"]
             or root_attribs == ["version", "{http://www.w3.org/XML/1998/namespace}base"]
@@ -271,8 +368,9 @@ class PlaylistBaseParser(BaseParser[Playlist]):
                 f"{forbidden_attributes}"
             )
 
-    def check_value_of_version(self) -> None:
-        version = int(self.xml_element.get("version", "0"))
+    @staticmethod
+    def check_value_of_version(root: Et.Element) -> None:
+        version = int(root.get("version", "0"))
         # 0 version not implemented
         if version == 0:
             raise ValueError(
@@ -320,13 +418,21 @@ class PlaylistBaseParser(BaseParser[Playlist]):
     def insert_date(self) -> None:
         date_string = self.get_xml_leaf_parameter_value("date")
         if date_string is not None:
-            date_string = date_string.strip()
-            date_object = datetime.fromisoformat(date_string)
+            date_object = self.parse_date(date_string.strip())
             self.insert_parameter_if_not_null("date", date_object)
 
+    @staticmethod
+    def parse_date(date_string: str) -> datetime:
+        try:
+            return datetime.fromisoformat(date_string)
+        except ValueError:
+            # `fromisoformat` understands `Z` designator since Python 3.11.
+            if not date_string.endswith("Z"):
+                raise
+        return datetime.fromisoformat(date_string[:-1] + "+00:00")
+
     def insert_attributions(self) -> None:
-        self.check_single_element_in_root("attribution")
-        attribution = self.xml_element.find("xspf:attribution", XML_NAMESPACE)
+        attribution = self.find_child("attribution")
         if attribution is not None:
             self.__class__.check_element_nonleaf_content(attribution)
             self.parsing_entity.attribution.extend(
@@ -334,17 +440,75 @@ class PlaylistBaseParser(BaseParser[Playlist]):
             )
 
     def insert_tracklist(self) -> None:
-        self.check_tracklist_is_only_one()
-        tracklist = self.xml_element.find("xspf:trackList", XML_NAMESPACE)
+        self.check_tracklist_exists()
+        tracklist = self.find_child("trackList")
         if tracklist is None:
             return
         self.check_element_nonleaf_content(tracklist)
+        if self.track_error is not None:
+            raise self.track_error
+        if self.parsed_tracks is not None:
+            self.parsing_entity.trackList.extend(self.parsed_tracks)
+            return
         self.parsing_entity.trackList.extend(
-            Track.parse_from_xml_element(track) for track in tracklist
+            TrackBaseParser(track, self.strings).parse() for track in tracklist
         )
 
-    def check_tracklist_is_only_one(self) -> None:
-        self.check_single_element_in_root("trackList")
-        track_list = self.xml_element.find("xspf:trackList", XML_NAMESPACE)
+    def check_tracklist_exists(self) -> None:
+        track_list = self.find_child("trackList")
         if track_list is None:
             raise TypeError("trackList element not founded.")
+
+
+class PlaylistStreamParser:
+    """Parse XSPF document in one pass over the ``iterparse`` events.
+
+    Root tag and attributes are checked as soon as the root is opened.
+    Every child of the playlist ``<trackList>`` is parsed into
+    :py:class:`xspf_lib.Track` as soon as its end tag is read, and the
+    element is cleared right after, so the tree never holds more than
+    one populated track. The rest of the document is checked by
+    :py:class:`PlaylistBaseParser` once the root is closed. An invalid
+    track is reported there too, in the same order as in
+    :py:meth:`xspf_lib.Playlist.parse_from_xml_element`.
+    """
+
+    def __init__(self, source: Union[str, bytes, int, IO[bytes]]):
+        self.source = source
+
+    def parse(self) -> Playlist:
+        root: Optional[Et.Element] = None
+        open_tags: List[str] = []
+        tracks: List[Track] = []
+        track_error: Optional[Exception] = None
+        strings: Dict[str, str] = {}
+        for event, element in Et.iterparse(self.source, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                    PlaylistBaseParser.check_root_tag_and_attributes(root)
+                open_tags.append(element.tag)
+                continue
+            if track_error is None and self.is_playlist_track(open_tags):
+                try:
+                    tracks.append(TrackBaseParser(element, strings).parse())
+                except (TypeError, ValueError) as error:
+                    # Raised by playlist parser after the checks preceding it.
+                    track_error = error
+                else:
+                    element.clear()
+            open_tags.pop()
+        # A document without root element fails in `iterparse` already.
+        assert root is not None
+        return PlaylistBaseParser(
+            root, parsed_tracks=tracks, strings=strings, track_error=track_error
+        ).parse()
+
+    @staticmethod
+    def is_playlist_track(open_tags: List[str]) -> bool:
+        """Check for any element right in the ``<trackList>`` of root."""
+        return (
+            len(open_tags) == 3
+            and open_tags[1] == _TRACKLIST_TAG
+            and open_tags[0] == _PLAYLIST_TAG
+        )
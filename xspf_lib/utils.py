@@ -1,23 +1,71 @@
+import re
+from functools import lru_cache
 from urllib import parse as urlparse
 
 from xspf_lib.constants import URI_CHARACTERS
 
+_URI_CHARACTERS_CLASS = re.escape(URI_CHARACTERS)
+_INVALID_URI_CHARACTER = re.compile(f"[^{_URI_CHARACTERS_CLASS}]")
+_VALID_URI = re.compile(f"[{_URI_CHARACTERS_CLASS}]*")
+
 
 def quote(value: str) -> str:
     return value
 
 
+def _quote_match(match: "re.Match[str]") -> str:
+    return urlparse.quote(match.group())
+
+
 def quote_invalid_chars(value: str) -> str:  # introduced by @gdalik
-    _value = ""
-    for char in value:
-        _char = char if char in URI_CHARACTERS else urlparse.quote(char)
-        _value += _char
-    return _value
+    return _INVALID_URI_CHARACTER.sub(_quote_match, value)
 
 
+@lru_cache(maxsize=4096)
 def urify(value):
+    """Return `value` as valid URI, quoting characters not allowed in URIs."""
+    if _VALID_URI.fullmatch(value) is not None:
+        return value
     value = quote_invalid_chars(value)  # introduced by @gdalik
-    if all(char in URI_CHARACTERS for char in value):
+    if _VALID_URI.fullmatch(value) is not None:
         return value
     else:
         raise ValueError("Only valid URI is acceptable.\n" f"Got `{value}`")
+
+
+@lru_cache(maxsize=4096)
+def escape_text(value: str) -> str:
+    """Escape XML character data, same as ElementTree serializer does.
+
+    Results are cached: playlists repeat the same creators, albums and
+    URIs over and over.
+    """
+    if "&" in value:
+        value = value.replace("&", "&amp;")
+    if "<" in value:
+        value = value.replace("<", "&lt;")
+    if ">" in value:
+        value = value.replace(">", "&gt;")
+    return value
+
+
+@lru_cache(maxsize=4096)
+def escape_attrib(value: str) -> str:
+    """Escape XML attribute value, writing `\\r`, `\\n` and `\\t` as character refs.
+
+    This matches ElementTree since Python 3.9, older versions turn `\\r`
+    into a newline instead.
+
+    Results are cached: `rel` and `application` values are usually
+    shared by many elements.
+    """
+    value = escape_text(value)
+    if '"' in value:
+        value = value.replace('"', "&quot;")
+    if "\r" in value:
+        value = value.replace("\r", "&#13;")
+    if "\n" in value:
+        value = value.replace("\n", "&#10;")
+    if "\t" in value:
+        value = value.replace("\t", "&#09;")
+    return value
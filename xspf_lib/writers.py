@@ -0,0 +1,275 @@
+__all__ = ["open_writer", "write_playlist", "write_track"]
+
+import codecs
+from contextlib import contextmanager
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree as Et
+
+from .constants import PLAYLIST_SIMPLE_FIELDS, TRACK_SIMPLE_FIELDS, XML_NAMESPACE
+from .utils import escape_attrib, escape_text, quote
+
+if TYPE_CHECKING:
+    from .elements import Extension, Link, Meta, Playlist, Track
+
+Write = Callable[[str], Any]
+
+_PLAYLIST_OPEN = '<playlist version="1" xmlns="' + XML_NAMESPACE["xspf"] + '">'
+_PLAYLIST_CLOSE = "</playlist>"
+_TRACK_OPEN = "<track>"
+_TRACK_CLOSE = "</track>"
+_TRACK_EMPTY = "<track />"
+_TRACKLIST_OPEN = "<trackList>"
+_TRACKLIST_CLOSE = "</trackList>"
+_TRACKLIST_EMPTY = "<trackList />"
+_ATTRIBUTION_OPEN = "<attribution>"
+_ATTRIBUTION_CLOSE = "</attribution>"
+_ATTRIBUTION_EMPTY = "<attribution />"
+_LINK_OPEN = '<link rel="'
+_LINK_CLOSE = "</link>"
+_META_OPEN = '<meta rel="'
+_META_CLOSE = "</meta>"
+_REL_END = '">'
+_REL_EMPTY_END = '" />'
+
+# Writer emits many small fragments, flush them to the file in big chunks.
+_BUFFER_SIZE = 1 << 16
+
+_LEAF_TAGS = (
+    "location",
+    "identifier",
+    "title",
+    "creator",
+    "annotation",
+    "info",
+    "image",
+    "album",
+    "trackNum",
+    "duration",
+    "date",
+    "license",
+)
+_get_track_simple_fields = attrgetter(*TRACK_SIMPLE_FIELDS)
+_get_playlist_simple_fields = attrgetter(*PLAYLIST_SIMPLE_FIELDS)
+_NO_TRACK_SIMPLE_FIELDS = (None,) * len(TRACK_SIMPLE_FIELDS)
+
+_LEAF_OPEN = {tag: "<" + tag + ">" for tag in _LEAF_TAGS}
+_LEAF_CLOSE = {tag: "</" + tag + ">" for tag in _LEAF_TAGS}
+_LEAF_EMPTY = {tag: "<" + tag + " />" for tag in _LEAF_TAGS}
+
+
+class _XMLWriter:
+    """Emit XSPF markup as text, without building an element tree.
+
+    Output is the same as the serialized result of
+    :py:mod:`xspf_lib.builders`.
+    """
+
+    def __init__(self, write: Write):
+        self.write = write
+        self.entity: Union["Track", "Playlist", None] = None
+
+    def write_track(self, track: "Track") -> None:
+        self.entity = track
+        simple_fields = _get_track_simple_fields(track)
+        if simple_fields == _NO_TRACK_SIMPLE_FIELDS and self.is_empty_track(track):
+            self.write(_TRACK_EMPTY)
+            return
+        self.write(_TRACK_OPEN)
+
+        self.add_locations()
+        self.add_identifiers()
+        self.add_simple_subelements(TRACK_SIMPLE_FIELDS, simple_fields)
+        self.add_links()
+        self.add_metas()
+        self.add_extensions()
+
+        self.write(_TRACK_CLOSE)
+
+    def write_playlist(self, playlist: "Playlist") -> None:
+        self.entity = playlist
+        self.write(_PLAYLIST_OPEN)
+
+        self.add_simple_subelements(
+            PLAYLIST_SIMPLE_FIELDS, _get_playlist_simple_fields(playlist)
+        )
+        self.add_date()
+        self.add_license()
+        self.add_attribution()
+        self.add_links()
+        self.add_metas()
+        self.add_extensions()
+        self.add_tracklist()
+
+        self.write(_PLAYLIST_CLOSE)
+
+    @staticmethod
+    def is_empty_track(track: "Track") -> bool:
+        """Check list fields, simple ones are compared by the caller."""
+        return (
+            not track.location
+            and not track.identifier
+            and not track.link
+            and not track.meta
+            and not track.extension
+        )
+
+    def add_locations(self):
+        if self.entity.location is not None:
+            for loc in self.entity.location:
+                loc = quote(loc)
+                self.add_leaf("location", loc if type(loc) is str else str(loc))
+
+    def add_identifiers(self):
+        if self.entity.identifier is not None:
+            for id in self.entity.identifier:
+                self.add_leaf("identifier", id if type(id) is str else str(id))
+
+    def add_license(self):
+        self.add_simple_subelement("license")
+
+    def add_attribution(self):
+        if len(self.entity.attribution) > 0:
+            write = self.write
+            attributions = [
+                attr
+                for attr in islice(self.entity.attribution, 9)
+                if attr.location is not None or attr.identifier is not None
+            ]
+            if not attributions:
+                write(_ATTRIBUTION_EMPTY)
+                return
+            write(_ATTRIBUTION_OPEN)
+            for attr in attributions:
+                if attr.location is not None:
+                    self.add_leaf("location", attr.location)
+                if attr.identifier is not None:
+                    self.add_leaf("identifier", attr.identifier)
+            write(_ATTRIBUTION_CLOSE)
+
+    def add_tracklist(self):
+        tracks = self.entity.trackList
+        if len(tracks) == 0:
+            self.write(_TRACKLIST_EMPTY)
+            return
+        self.write(_TRACKLIST_OPEN)
+        track_writer = _XMLWriter(self.write)
+        for track in tracks:
+            track_writer.write_track(track)
+        self.write(_TRACKLIST_CLOSE)
+
+    def add_links(self):
+        self.add_rel_elements(_LINK_OPEN, _LINK_CLOSE, self.entity.link)
+
+    def add_metas(self):
+        self.add_rel_elements(_META_OPEN, _META_CLOSE, self.entity.meta)
+
+    def add_extensions(self):
+        for extension in self.entity.extension:
+            self.add_extension(extension)
+
+    def add_date(self):
+        self.add_leaf("date", self.entity.date.isoformat())
+
+    def add_simple_subelement(self, parameter_name: str):
+        parameter = getattr(self.entity, parameter_name, None)
+        if parameter is not None:
+            self.add_leaf(parameter_name, str(parameter))
+
+    def add_simple_subelements(
+        self, parameter_names: Tuple[str, ...], parameters: Tuple[Any, ...]
+    ):
+        for parameter_name, parameter in zip(parameter_names, parameters):
+            if parameter is not None:
+                self.add_leaf(
+                    parameter_name,
+                    parameter if type(parameter) is str else str(parameter),
+                )
+
+    def add_leaf(self, tag: str, text: str):
+        write = self.write
+        if text:
+            write(_LEAF_OPEN[tag])
+            write(escape_text(text))
+            write(_LEAF_CLOSE[tag])
+        else:
+            write(_LEAF_EMPTY[tag])
+
+    def add_rel_elements(
+        self,
+        opening: str,
+        closing: str,
+        elements: Union[List["Link"], List["Meta"]],
+    ):
+        if not elements:
+            return
+        # Join all elements first and hand them to `write` at once.
+        parts: List[str] = []
+        append = parts.append
+        for element in elements:
+            rel = element.rel
+            if type(rel) is not str:
+                rel = str(rel)
+            content = element.content
+            if type(content) is not str:
+                content = str(content)
+            append(opening)
+            append(escape_attrib(rel))
+            if content:
+                append(_REL_END)
+                append(escape_text(content))
+                append(closing)
+            else:
+                append(_REL_EMPTY_END)
+        self.write("".join(parts))
+
+    def add_extension(self, extension: "Extension"):
+        # Extension content is arbitrary user markup, ElementTree handles it.
+        self.write(Et.tostring(extension.to_xml_element(), encoding="unicode"))
+
+
+def write_track(track: "Track", write: Write) -> None:
+    _XMLWriter(write).write_track(track)
+
+
+def write_playlist(playlist: "Playlist", write: Write) -> None:
+    _XMLWriter(write).write_playlist(playlist)
+
+
+@contextmanager
+def open_writer(
+    file_or_filename, encoding: Optional[str]
+) -> Iterator[Tuple[Write, str]]:
+    """Open text writer the same way :py:meth:`ElementTree.write` does.
+
+    File names are opened for writing in `encoding`, file objects get
+    encoded bytes unless `encoding` is ``"unicode"``. Missing
+    `encoding` means ``"us-ascii"``.
+    Yields `write` function and the encoding for XML declaration.
+    """
+    if not encoding:
+        encoding = "us-ascii"
+    try:
+        write = file_or_filename.write
+    except AttributeError:
+        if encoding.lower() == "unicode":
+            encoding = "utf-8"
+        with open(
+            file_or_filename,
+            "w",
+            buffering=_BUFFER_SIZE,
+            encoding=encoding,
+            errors="xmlcharrefreplace",
+        ) as file:
+            yield file.write, encoding
+        return
+    if encoding.lower() == "unicode":
+        yield write, getattr(file_or_filename, "encoding", None) or "utf-8"
+        return
+    # One encoder for the whole document, so a BOM is written only once.
+    encode = codecs.getincrementalencoder(encoding)("xmlcharrefreplace").encode
+    yield lambda text: write(encode(text)), encoding
+    tail = encode("", True)
+    if tail:
+        write(tail)